@@ -6,8 +6,21 @@ from __future__ import annotations
 
 import datetime
 import enum
+import functools
 import re
-from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import arrow
 import dateutil
@@ -29,6 +42,11 @@ from .models import (
     RecurringScheduler,
 )
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from markdown_it.token import Token
 
@@ -43,25 +61,236 @@ front matter.
 See https://markdown-it-py.readthedocs.io/en/latest/using.html#the-parser
 """
 
+_FRONT_MATTER_PATTERN = re.compile(
+    r"\A---[ \t]*\r?\n(?P<frontmatter>.*?)^ {0,3}-{3,}[ \t]*\r?$",
+    re.DOTALL | re.MULTILINE,
+)
+"""Regular expression pattern for extracting YAML front matter without
+parsing the full markdown document.
+"""
+
+_MD_RENDERER = MDRenderer()
+"""Shared mdformat renderer for rendering markdown tokens back to markdown."""
+
+_MD_OPTIONS = md.options
+"""Options of the `md` parser, passed to `_MD_RENDERER`."""
+
+_DATE_PARSER = dateutil.parser.parser()
+"""Shared dateutil parser for parsing fuzzy date strings."""
+
+_DATE_PARSER_DEFAULTS = (
+    datetime.datetime(2000, 1, 1),
+    datetime.datetime(2001, 3, 3),
+)
+"""Two defaults for `_DATE_PARSER` that differ in year, month, and day (in
+months with 31 days). A fuzzy date that parses differently with each is
+missing part of its date.
+"""
+
 timespan_pattern = re.compile(
-    r"((?P<weeks>\d+?)\s*(weeks|week|w))?\s*"
-    r"((?P<days>\d+?)\s*(days|day|d))?\s*"
-    r"((?P<hours>\d+?)\s*(hours|hour|hr|h))?\s*"
-    r"((?P<minutes>\d+?)\s*(minutes|minute|mins|min|m))?\s*"
-    r"((?P<seconds>\d+?)\s*(seconds|second|secs|sec|s))?$"
+    r"\A\s*+"
+    r"(?:(?P<weeks>\d++)\s*+(?:weeks|week|w))?\s*+"
+    r"(?:(?P<days>\d++)\s*+(?:days|day|d))?\s*+"
+    r"(?:(?P<hours>\d++)\s*+(?:hours|hour|hr|h))?\s*+"
+    r"(?:(?P<minutes>\d++)\s*+(?:minutes|minute|mins|min|m))?\s*+"
+    r"(?:(?P<seconds>\d++)\s*+(?:seconds|second|secs|sec|s))?\s*+\Z"
 )
-"""Regular expression pattern for a time duration."""
+"""Regular expression pattern for a time duration.
+
+This documents the grammar accepted by `parse_timedelta`, which uses a
+hand-written scanner rather than this pattern. Quantifiers are possessive
+and unit alternatives are ordered longest-first so that malformed input
+fails without backtracking.
+"""
+
+_UNIT_MAP: Dict[str, str] = {
+    "w": "weeks",
+    "week": "weeks",
+    "weeks": "weeks",
+    "d": "days",
+    "day": "days",
+    "days": "days",
+    "h": "hours",
+    "hr": "hours",
+    "hour": "hours",
+    "hours": "hours",
+    "m": "minutes",
+    "min": "minutes",
+    "mins": "minutes",
+    "minute": "minutes",
+    "minutes": "minutes",
+    "s": "seconds",
+    "sec": "seconds",
+    "secs": "seconds",
+    "second": "seconds",
+    "seconds": "seconds",
+}
+"""Mapping of time duration unit suffixes to `datetime.timedelta`
+arguments.
+"""
+
+_TIMESPAN_FIELDS = ("weeks", "days", "hours", "minutes", "seconds")
+"""The `datetime.timedelta` arguments, in the order they may appear in a
+time duration.
+"""
+
 
+def _scan_timedelta(text: str) -> Optional[Dict[str, int]]:
+    """Scan a time duration string in a single pass.
 
+    Returns
+    -------
+    `dict` or `None`
+        Keyword arguments for `datetime.timedelta`, or `None` if the text
+        is not a time duration that the scanner understands.
+    """
+    td_args: Dict[str, int] = {}
+    next_index = 0
+    n = len(text)
+    i = 0
+    while i < n:
+        if text[i].isspace():
+            i += 1
+            continue
+
+        start = i
+        while i < n and text[i].isdecimal():
+            i += 1
+        if i == start:
+            return None
+        value = int(text[start:i])
+
+        while i < n and text[i].isspace():
+            i += 1
+
+        start = i
+        while i < n and text[i].isalpha():
+            i += 1
+        suffix = text[start:i]
+
+        try:
+            field_name = _UNIT_MAP[suffix]
+        except KeyError:
+            return None
+
+        # Units must appear in order, and each at most once
+        field_index = _TIMESPAN_FIELDS.index(field_name)
+        if field_index < next_index:
+            return None
+        td_args[field_name] = value
+        next_index = field_index + 1
+    return td_args
+
+
+@functools.lru_cache(maxsize=256)
 def parse_timedelta(text: str) -> datetime.timedelta:
     """Parse a `datetime.timedelta` from a string containing integer numbers
     of weeks, days, hours, minutes, and seconds.
+
+    Results are cached since broadcasts tend to reuse the same durations.
     """
-    m = timespan_pattern.match(text.strip())
-    if m is None:
+    scanned_args = _scan_timedelta(text)
+    if scanned_args is None:
         raise ValueError(f"Could not parse a timespan from {text!r}.")
-    td_args = {k: int(v) for k, v in m.groupdict().items() if v is not None}
-    return datetime.timedelta(**td_args)
+    return datetime.timedelta(**scanned_args)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_cached(text: str) -> Tuple[Tuple[Token, ...], Dict[Any, Any]]:
+    """Parse markdown text into tokens and the markdown-it environment.
+
+    Results are cached so that unchanged broadcast content (for example,
+    content re-read from a GitHub repository) is not re-parsed. The results
+    are shared between `BroadcastMarkdown` instances, so callers must copy
+    the environment before passing it to anything that modifies it, such as
+    the renderer.
+
+    Parameters
+    ----------
+    text : `str`
+        The markdown content, including YAML front matter.
+    """
+    md_env: Dict[Any, Any] = {}
+    md_tokens = md.parse(text, md_env)
+    return tuple(md_tokens), md_env
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_front_matter_cached(text: str) -> BroadcastMarkdownFrontMatter:
+    """Parse the front matter metadata from markdown text.
+
+    The YAML front matter is extracted with `_FRONT_MATTER_PATTERN` when
+    possible so that the markdown body doesn't need to be parsed. Otherwise
+    this falls back to the front matter token from a full markdown parse.
+    Like `_parse_cached`, results are cached and shared; the front matter
+    is immutable.
+
+    Parameters
+    ----------
+    text : `str`
+        The markdown content, including YAML front matter.
+    """
+    m = _FRONT_MATTER_PATTERN.match(text)
+    if m is not None:
+        frontmatter = m.group("frontmatter")
+    else:
+        md_tokens, _ = _parse_cached(text)
+        frontmatter = BroadcastMarkdown._get_front_matter_token(
+            md_tokens
+        ).content
+    yaml_data = yaml.load(frontmatter, Loader=_YamlLoader)
+    return BroadcastMarkdownFrontMatter.from_mapping(yaml_data)
+
+
+def parse_all(
+    sources: Iterable[Tuple[str, str]], max_workers: Optional[int] = None
+) -> List[BroadcastMarkdown]:
+    """Parse many broadcast markdown messages in parallel across processes.
+
+    This is intended for cold-loading a large set of messages; the parse
+    caches only benefit the worker processes. For small or repeated loads,
+    construct `BroadcastMarkdown` objects directly so the caches in this
+    process are used.
+
+    Parameters
+    ----------
+    sources : iterable of tuple of (`str`, `str`)
+        The ``(text, identifier)`` pairs for each message.
+    max_workers : `int`, optional
+        The number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    `list` of `BroadcastMarkdown`
+        The broadcast markdown objects, in the same order as ``sources``.
+    """
+    sources = list(sources)
+    # Fail fast, before starting worker processes
+    for text, _ in sources:
+        _check_front_matter_fence(text)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_parse_one, sources, chunksize=16))
+
+
+def _check_front_matter_fence(text: str) -> None:
+    """Check that the text starts with a front matter fence, which is
+    cheaper than finding out from a full markdown parse.
+
+    Raises
+    ------
+    ValueError
+        Raised if the text can't have front matter.
+    """
+    if not text.startswith("---"):
+        raise ValueError(
+            "Front matter is not present in the markdown content."
+        )
+
+
+def _parse_one(source: Tuple[str, str]) -> BroadcastMarkdown:
+    """Parse a single ``(text, identifier)`` pair (a `parse_all` worker)."""
+    text, identifier = source
+    return BroadcastMarkdown(text, identifier)
 
 
 class BroadcastMarkdown:
@@ -78,21 +307,37 @@ class BroadcastMarkdown:
     """
 
     def __init__(self, text: str, identifier: str) -> None:
+        _check_front_matter_fence(text)
         self._text = text
         self.identifier = identifier
-        self._md_env: Dict[Any, Any] = {}
-        self._md_tokens = md.parse(text, self._md_env)
-        self._metadata = self._parse_metadata()
-
-    def _parse_metadata(self) -> BroadcastMarkdownFrontMatter:
-        frontmatter_token = self._get_front_matter_token()
-        yaml_data = yaml.safe_load(frontmatter_token.content)
-        return BroadcastMarkdownFrontMatter.parse_obj(yaml_data)
-
-    def _get_front_matter_token(self) -> Token:
-        for token in self._md_tokens:
-            if token.type == "front_matter":
-                return token
+        self._metadata = _parse_front_matter_cached(text)
+
+    @functools.cached_property
+    def _parsed_markdown(self) -> Tuple[Tuple[Token, ...], Dict[Any, Any]]:
+        """The markdown tokens and markdown-it environment, parsed on first
+        access since only the body needs them.
+        """
+        return _parse_cached(self._text)
+
+    @property
+    def _md_tokens(self) -> Tuple[Token, ...]:
+        return self._parsed_markdown[0]
+
+    @property
+    def _md_env(self) -> Dict[Any, Any]:
+        return self._parsed_markdown[1]
+
+    @functools.cached_property
+    def _body_tokens(self) -> Tuple[Token, ...]:
+        # The front matter token is always first (see _get_front_matter_token)
+        return self._md_tokens[1:]
+
+    @staticmethod
+    def _get_front_matter_token(md_tokens: Sequence[Token]) -> Token:
+        # front_matter_plugin only recognizes front matter at the start of the
+        # document, so it's always the first token.
+        if md_tokens and md_tokens[0].type == "front_matter":
+            return md_tokens[0]
         raise ValueError(
             "A front_matter token is not present in the markdown content."
         )
@@ -107,16 +352,18 @@ class BroadcastMarkdown:
         """The full text of the markdown message (including front-matter)."""
         return self._text
 
-    @property
+    @functools.cached_property
     def body(self) -> Optional[str]:
         """The text of the markdown body or `None` if the message doesn't have
         body content.
         """
-        body_tokens = [t for t in self._md_tokens if t.type != "front_matter"]
-        if len(body_tokens) == 0:
+        if not self._body_tokens:
             return None
         else:
-            return MDRenderer().render(body_tokens, md.options, self._md_env)
+            # The renderer modifies the env, which is shared via the cache
+            return _MD_RENDERER.render(
+                self._body_tokens, _MD_OPTIONS, dict(self._md_env)
+            )
 
     def is_relevant_to_env(self, env_name: str) -> bool:
         """Determine if this broadcast message is relevant to the given
@@ -208,21 +455,28 @@ class BroadcastMarkdown:
         )
 
     def _make_scheduler(self) -> Scheduler:
-        if self.metadata.defer is not None:
-            if self.metadata.expire is not None:
-                return OneTimeScheduler(
-                    self.metadata.defer, self.metadata.expire
-                )
+        # Schedulers work with arrow.Arrow rather than datetime.datetime
+        defer = (
+            arrow.Arrow.fromdatetime(self.metadata.defer)
+            if self.metadata.defer is not None
+            else None
+        )
+        expire = (
+            arrow.Arrow.fromdatetime(self.metadata.expire)
+            if self.metadata.expire is not None
+            else None
+        )
+        if defer is not None:
+            if expire is not None:
+                return OneTimeScheduler(defer, expire)
             elif self.metadata.ttl is not None:
-                return OneTimeScheduler.from_ttl(
-                    self.metadata.defer, self.metadata.ttl
-                )
+                return OneTimeScheduler.from_ttl(defer, self.metadata.ttl)
             else:
-                return OpenEndedScheduler(self.metadata.defer)
-        elif self.metadata.expire is not None:
+                return OpenEndedScheduler(defer)
+        elif expire is not None:
             # In this case, there is an expiration, but the defer must be
             # none, so it is a fixed-expiration scheduler
-            return FixedExpirationScheduler(self.metadata.expire)
+            return FixedExpirationScheduler(expire)
         elif self.metadata.rules is not None and self.metadata.ttl is not None:
             # Create a rruleset
             rset = dateutil.rrule.rruleset(cache=True)
@@ -237,7 +491,10 @@ class BroadcastMarkdown:
                         rset.exrule(rule.to_rrule())
                     else:
                         rset.rrule(rule.to_rrule())
-            return RecurringScheduler(rruleset=rset, ttl=self.metadata.ttl)
+            return RecurringScheduler(
+                rruleset=rset,
+                ttl=self.metadata.ttl,
+            )
         else:
             return PermaScheduler()
 
@@ -332,7 +589,7 @@ class RecurringRule(BaseModel):
     datetimes.
     """
 
-    date: Optional[arrow.Arrow] = None
+    date: Optional[datetime.datetime] = None
     """A fixed datetime to include (or exclude) from the recurrence."""
 
     freq: Optional[FreqEnum] = None
@@ -345,12 +602,12 @@ class RecurringRule(BaseModel):
     rule triggers every two months.
     """
 
-    start: Optional[arrow.Arrow] = None
+    start: Optional[datetime.datetime] = None
     """The date when the repeating rule starts. If not set, the rule is
     assumed to start now.
     """
 
-    end: Optional[arrow.Arrow] = None
+    end: Optional[datetime.datetime] = None
     """Then date when this rule ends. The last recurrence is the datetime
     that is less than or equal to this date. If not set, the rule can recur
     infinitely.
@@ -411,24 +668,28 @@ class RecurringRule(BaseModel):
     exclude: bool = False
     """Set to True to exclude these events from the schedule."""
 
-    @validator("timezone", pre=True, allow_reuse=True)
-    def preprocess_timezone(
-        cls, v: Any, values: Dict[str, Any], **kwargs: Any
-    ) -> datetime.tzinfo:
-        """Convert a timezone into a tzinfo instance."""
-        return convert_to_tzinfo(v)
-
-    @validator("date", "start", "end", pre=True, allow_reuse=True)
-    def preprocess_optional_arrow(
-        cls, v: Any, values: Dict[str, Any], **kwargs: Any
-    ) -> Optional[arrow.Arrow]:
-        """Convert a datetime into a arrow.Arrow, or None."""
-        if v is None:
-            return v
-        else:
-            return convert_to_arrow(
-                v, default_tz=values.get("timezone", dateutil.tz.UTC)
-            )
+    @root_validator(pre=True)
+    def preprocess_datetimes(
+        cls, values: Mapping[str, Any]
+    ) -> Mapping[str, Any]:
+        """Convert the timezone into a tzinfo instance, and then the
+        ``date``, ``start``, and ``end`` fields into timezone-aware
+        datetimes.
+
+        The timezone is resolved once and used as the default timezone for
+        each of the datetime fields.
+        """
+        values = dict(values)
+        timezone = values.get("timezone")
+        if timezone is not None:
+            timezone = convert_to_tzinfo(timezone)
+            values["timezone"] = timezone
+        default_tz = timezone or dateutil.tz.UTC
+        for key in ("date", "start", "end"):
+            v = values.get(key)
+            if v is not None:
+                values[key] = convert_to_datetime(v, default_tz=default_tz)
+        return values
 
     @validator("by_set_position", "by_year_day", each_item=True)
     def check_year_day_index(cls, v: int) -> int:
@@ -539,14 +800,14 @@ class RecurringRule(BaseModel):
         else:
             return dateutil.rrule.rrule(
                 freq=self.freq.to_rrule_freq(),
-                dtstart=self.start.datetime if self.start else None,
+                dtstart=self.start,
                 interval=self.interval,
                 wkst=(
                     self.week_start.to_rrule_weekday()
                     if self.week_start
                     else None
                 ),
-                until=self.end.datetime if self.end else None,
+                until=self.end,
                 bysetpos=self.by_set_position,
                 bymonth=self.by_month,
                 bymonthday=self.by_month_day,
@@ -569,17 +830,22 @@ class RecurringRule(BaseModel):
                 "Cannot export a recurrence-based rule as a single date. "
                 "Use to_rrule() in this case."
             )
-        return self.date.datetime
+        return self.date
 
     class Config:
         """Model configuration."""
 
         arbitrary_types_allowed = True
+        allow_mutation = False
+
 
+@dataclass(slots=True, frozen=True)
+class BroadcastMarkdownFrontMatter:
+    """The front-matter from a markdown broadcast message.
 
-class BroadcastMarkdownFrontMatter(BaseModel):
-    """A pydantic model describing the front-matter from a markdown broadcast
-    message.
+    Use `from_mapping` to create an instance from the YAML front matter.
+    Instances are immutable since parsed front matter is cached and shared
+    between `BroadcastMarkdown` instances.
     """
 
     summary: Optional[str] = None
@@ -589,29 +855,29 @@ class BroadcastMarkdownFrontMatter(BaseModel):
     paragraph of the body.
     """
 
-    env: Optional[List[str]] = None
-    """The list of applicable environments. None implies that the broadcast
+    env: Optional[Tuple[str, ...]] = None
+    """The applicable environments. None implies that the broadcast
     is applicable to all environments.
     """
 
-    timezone: datetime.tzinfo = dateutil.tz.UTC
+    timezone: datetime.tzinfo = field(default_factory=dateutil.tz.tzutc)
     """Default timezone for any datetime fields that don't contain explicit
     datetimes.
 
     If not set, the default timezone is UTC.
     """
 
-    defer: Optional[arrow.Arrow] = None
+    defer: Optional[datetime.datetime] = None
     """Date when the message is deferred to start."""
 
-    expire: Optional[arrow.Arrow] = None
+    expire: Optional[datetime.datetime] = None
     """Date when the message expires."""
 
-    ttl: Optional[datetime.timedelta] = None
-    """Time duration if `expire` is not set with `defer`."""
+    ttl: Optional[int] = None
+    """Time duration, in seconds, if `expire` is not set with `defer`."""
 
-    rules: Optional[List[RecurringRule]] = None
-    """For creating a repeating schedule, a list of rrule or dates to
+    rules: Optional[Tuple[RecurringRule, ...]] = None
+    """For creating a repeating schedule, the rrules or dates to
     include or exclude.
     """
 
@@ -621,114 +887,136 @@ class BroadcastMarkdownFrontMatter(BaseModel):
     category: BroadcastCategory = BroadcastCategory.maintenance
     """Broadcast category."""
 
-    @root_validator(pre=True)
-    def propagate_timezone(
-        cls, values: Mapping[str, Any]
-    ) -> Mapping[str, Any]:
-        """A pre-validator that propagates timezone info from the top-level,
-        if present, into individual rules items, if present, and if those
-        items do not already have a non-None timezone.
-        """
-        if "timezone" in values.keys():
-            default_tz = values["timezone"]
-            if "rules" in values.keys():
-                for r in values["rules"]:
-                    if r.get("timezone") is None:
-                        r["timezone"] = default_tz
+    def __post_init__(self) -> None:
+        self._check_schedule_combinations()
 
-        return values
+    @classmethod
+    def from_mapping(
+        cls, data: Mapping[str, Any]
+    ) -> BroadcastMarkdownFrontMatter:
+        """Create front matter from a mapping, such as parsed YAML, converting
+        values into their field types.
 
-    @validator("env", pre=True)
-    def preprocess_env(
-        cls, v: Union[str, List[str]], **kwargs: Any
-    ) -> Optional[List[str]]:
-        """Convert the string form of the env keyword to a list, supporting
-        comma-separated lists as well.
-        """
-        if isinstance(v, str):
-            return [s.strip() for s in v.split(",")]
-        else:
-            return v
+        Parameters
+        ----------
+        data : `collections.abc.Mapping`
+            The front matter data. Unknown keys are ignored.
 
-    @validator("timezone", pre=True, allow_reuse=True)
-    def preprocess_timezone(
-        cls, v: Any, values: Dict[str, Any], **kwargs: Any
-    ) -> datetime.tzinfo:
-        """Convert a timezone into a tzinfo instance."""
-        return convert_to_tzinfo(v)
-
-    @validator("defer", "expire", pre=True, allow_reuse=True)
-    def preprocess_optional_arrow(
-        cls, v: Any, values: Dict[str, Any], **kwargs: Any
-    ) -> Optional[arrow.Arrow]:
-        """Convert the nullable arrow.Arrow fields from either date.date,
-        date.datetime, or fuzzy string froms into arrow.Arrow types with
-        timezone information.
-
-        If a timezone is not set, the timezone defaults to the value of the
-        `timezone` field.
+        Returns
+        -------
+        `BroadcastMarkdownFrontMatter`
+            The front matter.
+
+        Raises
+        ------
+        ValueError
+            Raised if a value can't be converted or if the combination of
+            scheduling fields is invalid.
+        TypeError
+            Raised if a value has an incorrect type.
         """
-        if v is None:
-            return None
-        else:
-            return convert_to_arrow(
-                v, default_tz=values.get("timezone", dateutil.tz.UTC)
+        if not isinstance(data, Mapping):
+            raise ValueError(f"Front matter must be a mapping, got {data!r}.")
+
+        summary = data.get("summary")
+        if summary is not None:
+            summary = str(summary)
+
+        env = data.get("env")
+        if isinstance(env, str):
+            # Support comma-separated lists as well
+            env = tuple(s.strip() for s in env.split(","))
+        elif isinstance(env, list):
+            env = tuple(str(e) for e in env)
+        elif env is not None:
+            raise TypeError(
+                f"env must be a string or a list of strings, got {env!r}."
             )
 
-    @validator("ttl", pre=True, allow_reuse=True)
-    def preprocess_timedelta(
-        cls, v: Any, values: Dict[str, Any], **kwargs: Any
-    ) -> Optional[datetime.timedelta]:
-        if v is None:
-            return None
+        if "timezone" in data:
+            timezone = convert_to_tzinfo(data["timezone"])
         else:
-            return convert_to_timedelta(v)
+            timezone = dateutil.tz.UTC
+
+        defer = data.get("defer")
+        if defer is not None:
+            defer = convert_to_datetime(defer, default_tz=timezone)
+
+        expire = data.get("expire")
+        if expire is not None:
+            expire = convert_to_datetime(expire, default_tz=timezone)
+
+        ttl = data.get("ttl")
+        if ttl is not None:
+            ttl = convert_to_seconds(ttl)
+
+        rules = data.get("rules")
+        if rules is not None:
+            if not isinstance(rules, list) or not all(
+                isinstance(r, Mapping) for r in rules
+            ):
+                raise TypeError(
+                    f"rules must be a list of mappings, got {rules!r}."
+                )
+            # Rules default to the top-level timezone
+            rules = tuple(
+                RecurringRule.parse_obj(
+                    r
+                    if r.get("timezone") is not None
+                    else {**r, "timezone": timezone}
+                )
+                for r in rules
+            )
 
-    @root_validator
-    def check_schedule_combinations(
-        cls, values: Mapping[str, Any]
-    ) -> Mapping[str, Any]:
+        enabled = convert_to_bool(data.get("enabled", True))
+
+        category = BroadcastCategory(
+            data.get("category", BroadcastCategory.maintenance)
+        )
+
+        return cls(
+            summary=summary,
+            env=env,
+            timezone=timezone,
+            defer=defer,
+            expire=expire,
+            ttl=ttl,
+            rules=rules,
+            enabled=enabled,
+            category=category,
+        )
+
+    def _check_schedule_combinations(self) -> None:
         # expire and ttl cannot coexist
-        if values.get("expire") is not None and values.get("ttl") is not None:
+        if self.expire is not None and self.ttl is not None:
             raise ValueError(
                 '"expire" and "ttl" fields cannot be used together.'
             )
 
         # defer must be before expire
-        if (
-            values.get("defer") is not None
-            and values.get("expire") is not None
-        ):
-            _defer = values.get("defer")
-            assert isinstance(_defer, arrow.Arrow)  # for type-checking
-            _expire = values.get("expire")
-            assert isinstance(_expire, arrow.Arrow)  # for type-checking
-            if _expire < _defer:
+        if self.defer is not None and self.expire is not None:
+            if self.expire < self.defer:
                 raise ValueError('"expire" cannot happen before "defer"')
 
         # rules does not coexist with defer or expire
-        if values.get("rules") is not None and values.get("defer") is not None:
+        if self.rules is not None and self.defer is not None:
             raise ValueError(
                 '"rules" and "defer" fields cannot be used together.'
             )
-        if (
-            values.get("rules") is not None
-            and values.get("expire") is not None
-        ):
+        if self.rules is not None and self.expire is not None:
             raise ValueError(
                 '"rules" and "expire" fields cannot be used together.'
             )
 
         # rules must be used with ttl
-        if values.get("rules") is not None and values.get("ttl") is None:
+        if self.rules is not None and self.ttl is None:
             raise ValueError('"ttl" must be specified with rules.')
 
-        return values
 
-    class Config:
-        """Model configuration."""
-
-        arbitrary_types_allowed = True
+@functools.lru_cache(maxsize=64)
+def _gettz(name: str) -> Optional[datetime.tzinfo]:
+    """Look up a timezone by name, caching the result."""
+    return dateutil.tz.gettz(name)
 
 
 def convert_to_tzinfo(v: Any) -> datetime.tzinfo:
@@ -746,7 +1034,7 @@ def convert_to_tzinfo(v: Any) -> datetime.tzinfo:
     if isinstance(v, datetime.tzinfo):
         return v
     elif isinstance(v, str):
-        tz = dateutil.tz.gettz(v)
+        tz = _gettz(v)
         if not isinstance(tz, datetime.tzinfo):
             raise ValueError(f"Could not parse timezone from {v!s}")
         return tz
@@ -754,12 +1042,14 @@ def convert_to_tzinfo(v: Any) -> datetime.tzinfo:
         raise TypeError(f"Incorrect type for timezone, got {v!r}.")
 
 
-def convert_to_arrow(v: Any, default_tz: Optional[Any] = None) -> arrow.Arrow:
-    """Convert a value to an arrow.Arrow datetime.
+def convert_to_datetime(
+    v: Any, default_tz: Optional[Any] = None
+) -> datetime.datetime:
+    """Convert a value to a timezone-aware datetime.datetime.
 
-    This function is intended to be used in a validator for Pydantic models,
-    and will raise ValueErrors or TypeErrors if ``v`` is not an appropriate
-    value.
+    This function is intended to be used when converting front matter
+    values, and will raise ValueErrors or TypeErrors if ``v`` is not an
+    appropriate value.
 
     Parameters
     ----------
@@ -771,49 +1061,91 @@ def convert_to_arrow(v: Any, default_tz: Optional[Any] = None) -> arrow.Arrow:
     """
     if v is None:
         raise ValueError("Cannot determine date from None")
-    elif isinstance(v, datetime.date):
-        # Pydantic pre-parses YYYY-MM-DD into a datetime.date even if
-        # we didn't declare the field as a datetime.date type
-        dt = datetime.datetime.combine(v, datetime.time())
     elif isinstance(v, datetime.datetime):
-        # Pydantic pre-parses timestamps into datetime.datetime even if
-        # we didn't declare the field as a datetime.datetime type
-        # Pydantic pre-parses into a datetime
+        # YAML pre-parses full timestamps into a datetime.datetime
         dt = v
+    elif isinstance(v, datetime.date):
+        # YAML pre-parses YYYY-MM-DD into a datetime.date
+        dt = datetime.datetime.combine(v, datetime.time())
     elif isinstance(v, str):
+        # Fast path for ISO 8601 timestamps; dateutil handles fuzzy dates
         try:
-            dt = dateutil.parser.parse(v, fuzzy=True, yearfirst=True)
-        except (ValueError, OverflowError):
-            raise ValueError("Could not parse date")
+            dt = datetime.datetime.fromisoformat(v)
+        except ValueError:
+            try:
+                dt, dt_check = [
+                    _DATE_PARSER.parse(
+                        v, default=default, fuzzy=True, yearfirst=True
+                    )
+                    for default in _DATE_PARSER_DEFAULTS
+                ]
+            except (ValueError, OverflowError):
+                raise ValueError("Could not parse date")
+            # Dates missing a year, month, or day would otherwise be filled
+            # in from the current date, which changes from day to day and
+            # can't be cached.
+            if dt != dt_check:
+                raise ValueError(
+                    f"Date must include a year, month, and day: {v!r}"
+                )
     else:
         raise TypeError(f"Not a string (got {v!r})")
 
     if dt.tzinfo:
         # Parsed date includes a timezone.
-        return arrow.get(dt)
+        return dt
     else:
         # naive datetime, so default to given timezone
-        if default_tz:
-            return arrow.get(dt, default_tz)
-        else:
-            return arrow.get(dt, dateutil.tz.UTC)
+        return dt.replace(tzinfo=default_tz or dateutil.tz.UTC)
 
 
-def convert_to_timedelta(v: Any) -> datetime.timedelta:
-    """Convert a value to a datetime.timedelta.
+_TRUE_VALUES = frozenset({1, "1", "on", "t", "true", "y", "yes"})
+"""Values accepted as `True` by `convert_to_bool` (besides `True`)."""
 
-    This function is intended to be used in a validator for Pydantic models,
-    and will raise ValueErrors or TypeErrors if ``v`` is not an appropriate
-    value.
+_FALSE_VALUES = frozenset({0, "0", "off", "f", "false", "n", "no"})
+"""Values accepted as `False` by `convert_to_bool` (besides `False`)."""
+
+
+def convert_to_bool(v: Any) -> bool:
+    """Convert a value to a bool, accepting the same values that Pydantic's
+    bool fields accept.
+
+    Parameters
+    ----------
+    v : bool, int, str
+        A bool, the integers ``0`` or ``1``, or a string such as ``"yes"``
+        or ``"off"`` (case-insensitive).
+    """
+    if isinstance(v, bool):
+        return v
+    if isinstance(v, str):
+        v = v.lower()
+    if isinstance(v, (int, str)):
+        if v in _TRUE_VALUES:
+            return True
+        if v in _FALSE_VALUES:
+            return False
+    raise TypeError(f"Cannot parse a boolean from {v!r}")
+
+
+def convert_to_seconds(v: Any) -> int:
+    """Convert a time duration to an integer number of seconds.
+
+    This function is intended to be used when converting front matter
+    values, and will raise ValueErrors or TypeErrors if ``v`` is not an
+    appropriate value.
 
     Parameters
     ----------
-    v : datetime.timedelta, str
-        A value to convert into a timedelta.
+    v : int, datetime.timedelta, str
+        A value to convert into a number of seconds. Integers are taken to
+        already be a number of seconds.
     """
     if isinstance(v, str):
-        return parse_timedelta(v)
+        return int(parse_timedelta(v).total_seconds())
     elif isinstance(v, datetime.timedelta):
+        return int(v.total_seconds())
+    elif isinstance(v, int) and not isinstance(v, bool):
         return v
     else:
-        raise TypeError(f"Cannot parse timedelta from {v!r}")
+        raise TypeError(f"Cannot parse a time duration from {v!r}")
@@ -10,7 +10,6 @@ from typing import TYPE_CHECKING
 import arrow
 
 if TYPE_CHECKING:
-    import datetime
     from typing import Optional, Tuple
 
     import dateutil.rrule
@@ -108,24 +107,22 @@ class OneTimeScheduler(Scheduler):
     """The end date."""
 
     @classmethod
-    def from_ttl(
-        cls, start: arrow.Arrow, ttl: datetime.timedelta
-    ) -> OneTimeScheduler:
+    def from_ttl(cls, start: arrow.Arrow, ttl: int) -> OneTimeScheduler:
         """Create a OneTimeScheduler given a known start date and a TTL.
 
         Parameters
         ----------
         start : `arrow.Arrow`
             A start date as an arrow object.
-        ttl : `datetime.timedela`
-            The duration of the event.
+        ttl : `int`
+            The duration of the event, in seconds.
 
         Returns
         -------
         `OneTimeScheduler`
             The scheduler.
         """
-        end = start.shift(seconds=ttl.total_seconds())
+        end = start.shift(seconds=ttl)
         return cls(start, end)
 
     def is_active(self) -> bool:
@@ -148,20 +145,18 @@ class RecurringScheduler(Scheduler):
         both repeats, one-time dates, one-time exclusions, and so on. The
         rruleset **must** have a UTC timezone. Time zones are not validated
         by the constructor.
-    ttl : `datetime.timedela`
-        The duration of the event.
+    ttl : `int`
+        The duration of the event, in seconds.
     """
 
-    def __init__(
-        self, rruleset: dateutil.rrule.rruleset, ttl: datetime.timedelta
-    ) -> None:
+    def __init__(self, rruleset: dateutil.rrule.rruleset, ttl: int) -> None:
         self.rruleset = rruleset
         self.ttl = ttl
 
         # Get the next start date from now (but rewinding by the ttl in case
         # the message is active **right now**.
         start_datetime = rruleset.after(
-            arrow.utcnow().shift(seconds=-ttl.total_seconds()).datetime,
+            arrow.utcnow().shift(seconds=-ttl).datetime,
             inc=True,
         )
         if start_datetime is None:
@@ -169,7 +164,7 @@ class RecurringScheduler(Scheduler):
             # OneTimeScheduler, try to build the scheduler with an already-old
             # start.
             start_datetime = rruleset.before(
-                arrow.utcnow().shift(seconds=-ttl.total_seconds()).datetime,
+                arrow.utcnow().shift(seconds=-ttl).datetime,
                 inc=True,
             )
             if start_datetime is None:
@@ -178,9 +173,9 @@ class RecurringScheduler(Scheduler):
         self._start = arrow.get(start_datetime)
 
     @property
-    def ttl_seconds(self) -> float:
+    def ttl_seconds(self) -> int:
         """The TTL, in seconds."""
-        return self.ttl.total_seconds()
+        return self.ttl
 
     @property
     def _end(self) -> arrow.Arrow:
@@ -8,12 +8,16 @@ from typing import TYPE_CHECKING
 import arrow
 import dateutil
 import pytest
-from pydantic import ValidationError
 
 from semaphore.broadcast.markdown import (
     BroadcastMarkdown,
     BroadcastMarkdownFrontMatter,
+    _scan_timedelta,
+    convert_to_datetime,
+    convert_to_seconds,
+    parse_all,
     parse_timedelta,
+    timespan_pattern,
 )
 from semaphore.broadcast.models import (
     FixedExpirationScheduler,
@@ -65,6 +69,94 @@ def test_parse_timedelta(value: str, expected: datetime.timedelta) -> None:
     assert td == expected
 
 
+@pytest.mark.parametrize("value", ["1x", "1d1w", "1d 1d", "w", "1.5h"])
+def test_parse_timedelta_invalid(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_timedelta(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "  ",
+        "1w",
+        " 2 weeks 3days\t4hr 5 mins 6s \n",
+        "1w1d1h1m1s",
+        "1minutes",
+        "1ms",
+        "1d1w",
+        "1d 1d",
+        "1x",
+        "w",
+        "1",
+        "1.5h",
+        "1 week two days",
+        "1h-",
+    ],
+)
+def test_timespan_pattern_matches_scanner(value: str) -> None:
+    """timespan_pattern documents the grammar that parse_timedelta's scanner
+    accepts, so both must accept the same inputs.
+    """
+    m = timespan_pattern.match(value)
+    scanned_args = _scan_timedelta(value)
+    assert bool(m) == (scanned_args is not None)
+    if m is not None:
+        groups = {k: int(v) for k, v in m.groupdict().items() if v}
+        assert groups == scanned_args
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2021-01-01", datetime.datetime(2021, 1, 1, tzinfo=dateutil.tz.UTC)),
+        (
+            "2021-01-01T12:30:00",
+            datetime.datetime(2021, 1, 1, 12, 30, tzinfo=dateutil.tz.UTC),
+        ),
+        (
+            "2021-01-01 12:00:00+02:00",
+            datetime.datetime(
+                2021, 1, 1, 12, tzinfo=dateutil.tz.tzoffset(None, 7200)
+            ),
+        ),
+        (
+            "2021-01-01 12pm",
+            datetime.datetime(2021, 1, 1, 12, tzinfo=dateutil.tz.UTC),
+        ),
+    ],
+)
+def test_convert_to_datetime(value: str, expected: datetime.datetime) -> None:
+    assert convert_to_datetime(value) == expected
+
+
+@pytest.mark.parametrize("value", ["12pm", "January 1 at 4am", "March 2021"])
+def test_convert_to_datetime_partial_date(value: str) -> None:
+    """Dates that would be completed from the current date are rejected."""
+    with pytest.raises(ValueError):
+        convert_to_datetime(value)
+
+
+def test_convert_to_datetime_from_yaml_types() -> None:
+    """YAML pre-parses dates and timestamps; times must be kept."""
+    la = dateutil.tz.gettz("America/Los Angeles")
+    assert convert_to_datetime(
+        datetime.datetime(2021, 1, 1, 12), default_tz=la
+    ) == datetime.datetime(2021, 1, 1, 12, tzinfo=la)
+    assert convert_to_datetime(
+        datetime.date(2021, 1, 1), default_tz=la
+    ) == datetime.datetime(2021, 1, 1, tzinfo=la)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [("1h30m", 5400), (datetime.timedelta(minutes=2), 120), (60, 60)],
+)
+def test_convert_to_seconds(value: object, expected: int) -> None:
+    assert convert_to_seconds(value) == expected
+
+
 def test_evergreen(broadcasts_dir: Path) -> None:
     source_path = "evergreen.md"
     text = broadcasts_dir.joinpath(source_path).read_text()
@@ -170,7 +262,7 @@ def test_env_list(broadcasts_dir: Path) -> None:
 
     md = BroadcastMarkdown(text, source_path)
     assert md.metadata.summary is None
-    assert md.metadata.env == ["idfprod", "stable"]
+    assert md.metadata.env == ("idfprod", "stable")
     assert md.body == expected_body_pre
 
     broadcast = md.to_broadcast()
@@ -198,7 +290,7 @@ def test_env_string(broadcasts_dir: Path) -> None:
 
     md = BroadcastMarkdown(text, source_path)
     assert md.metadata.summary is None
-    assert md.metadata.env == ["idfprod"]
+    assert md.metadata.env == ("idfprod",)
     assert md.body == expected_body_pre
 
     broadcast = md.to_broadcast()
@@ -305,6 +397,7 @@ def test_defer_expire_fuzzy_default_tz(broadcasts_dir: Path) -> None:
 
     md = BroadcastMarkdown(text, source_path)
     assert md.metadata.timezone == dateutil.tz.gettz("America/Los Angeles")
+    assert isinstance(md.metadata.defer, datetime.datetime)
 
     broadcast = md.to_broadcast()
     scheduler = broadcast.scheduler
@@ -371,8 +464,8 @@ def test_patch_thursday(broadcasts_dir: Path) -> None:
 
 def test_frontmatter_expire_ttl_conflict() -> None:
     """If frontmatter has both ttl and expire, validation should fail."""
-    with pytest.raises(ValidationError):
-        BroadcastMarkdownFrontMatter.parse_obj(
+    with pytest.raises(ValueError):
+        BroadcastMarkdownFrontMatter.from_mapping(
             dict(
                 summary="The summary",
                 start="2021-01-01 12pm",
@@ -382,13 +475,101 @@ def test_frontmatter_expire_ttl_conflict() -> None:
         )
 
 
+@pytest.mark.parametrize(
+    "data",
+    [
+        dict(summary="The summary", env={"a": 1}),
+        dict(summary="The summary", env=1),
+        dict(summary="The summary", ttl="2h", rules=["x"]),
+        dict(summary="The summary", ttl="2h", rules={"a": 1}),
+        dict(summary="The summary", enabled="maybe"),
+        dict(summary="The summary", enabled=2),
+    ],
+)
+def test_frontmatter_bad_types(data: dict) -> None:
+    with pytest.raises(TypeError):
+        BroadcastMarkdownFrontMatter.from_mapping(data)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [(True, True), (1, True), ("yes", True), (0, False), ("Off", False)],
+)
+def test_frontmatter_enabled(value: object, expected: bool) -> None:
+    """enabled accepts the same values as Pydantic's bool coercion."""
+    metadata = BroadcastMarkdownFrontMatter.from_mapping(
+        dict(summary="The summary", enabled=value)
+    )
+    assert metadata.enabled is expected
+
+
+def test_frontmatter_not_mapping() -> None:
+    with pytest.raises(ValueError):
+        BroadcastMarkdownFrontMatter.from_mapping(["summary"])  # type: ignore
+
+
+def test_frontmatter_frozen(broadcasts_dir: Path) -> None:
+    text = broadcasts_dir.joinpath("env-list.md").read_text()
+    metadata = BroadcastMarkdown(text, "env-list.md").metadata
+    assert isinstance(metadata.env, tuple)
+    with pytest.raises(AttributeError):
+        metadata.summary = "Changed"  # type: ignore
+
+
 def test_frontmatter_expire_before_defer() -> None:
     """If frontmatter defer is before start, validation should fail."""
-    with pytest.raises(ValidationError):
-        BroadcastMarkdownFrontMatter.parse_obj(
+    with pytest.raises(ValueError):
+        BroadcastMarkdownFrontMatter.from_mapping(
             dict(
                 summary="The summary",
                 defer="2021-01-02 12pm",
                 expire="2021-01-01 1pm",
             )
         )
+
+
+def test_parse_cache(broadcasts_dir: Path) -> None:
+    """Parsing the same content twice reuses the cached parse results."""
+    source_path = "evergreen.md"
+    text = broadcasts_dir.joinpath(source_path).read_text()
+
+    md1 = BroadcastMarkdown(text, source_path)
+    md2 = BroadcastMarkdown(text, "other.md")
+    assert md1.metadata is md2.metadata
+    assert md2.identifier == "other.md"
+    assert md1.body == md2.body
+
+
+def test_lazy_body_parse(broadcasts_dir: Path) -> None:
+    """The markdown body isn't parsed until it's needed."""
+    source_path = "defer-ttl.md"
+    text = broadcasts_dir.joinpath(source_path).read_text()
+
+    md = BroadcastMarkdown(text, source_path)
+    assert md.metadata.ttl == 3600
+    assert "_parsed_markdown" not in md.__dict__
+
+    md.to_broadcast()
+    assert "_parsed_markdown" in md.__dict__
+
+
+def test_missing_front_matter() -> None:
+    with pytest.raises(ValueError):
+        BroadcastMarkdown("Just a body.\n", "no-front-matter.md")
+
+
+def test_parse_all(broadcasts_dir: Path) -> None:
+    source_paths = ["evergreen.md", "defer-ttl.md", "patch-thursday.md"]
+    sources = [
+        (broadcasts_dir.joinpath(p).read_text(), p) for p in source_paths
+    ]
+
+    messages = parse_all(sources, max_workers=2)
+    assert [m.identifier for m in messages] == source_paths
+    assert messages[1].metadata.ttl == 3600
+    assert isinstance(messages[2].to_broadcast().scheduler, RecurringScheduler)
+
+
+def test_parse_all_missing_front_matter() -> None:
+    with pytest.raises(ValueError):
+        parse_all([("Just a body.\n", "no-front-matter.md")])